@@ -2,12 +2,15 @@ from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import copy
+import threading
 
-from flask import request, jsonify
+from flask import request, jsonify, Response
 
-from flexget.plugins.daemon.scheduler import schedule_schema, scheduler, scheduler_job_map, DEFAULT_SCHEDULES
+from flexget.plugins.daemon import scheduler as scheduler_plugin
+from flexget.plugins.daemon.scheduler import schedule_schema, job_id, DEFAULT_SCHEDULES
 from flexget.api import api, APIResource
 from flexget.api.app import NotFoundError, APIError, base_message_schema, success_response, etag, Conflict
+from flexget.event import event
 
 schedule_api = api.namespace('schedules', description='Task Scheduler')
 
@@ -16,7 +19,9 @@ class ObjectsContainer(object):
     # SwaggerUI does not yet support anyOf or oneOf
     schedule_object = copy.deepcopy(schedule_schema)
     schedule_object['properties']['id'] = {'type': 'integer'}
-    schedule_object['maxProperties'] += 1
+    # Only included in schedule details when running as a daemon
+    schedule_object['properties']['next_run_time'] = {'type': 'string'}
+    schedule_object['maxProperties'] += 2
 
     schedules_list = {'type': 'array', 'items': schedule_object}
 
@@ -26,13 +31,56 @@ api_schedule_schema = api.schema('schedules.schedule', ObjectsContainer.schedule
 api_schedules_list_schema = api.schema('schedules.list', ObjectsContainer.schedules_list)
 
 
+# Last indexed schedules list and a map of schedule ids to their position in it, as a (schedules, index) tuple.
+# Replaced as a whole so that concurrent requests never see a partially built index, see `_schedule_position`
+_schedule_index = None
+# Serialized schedules list response as a (schedules, data) tuple
+_schedules_response = None
+# Bumped whenever the caches are invalidated. A cache built while this changed may be stale and is not stored.
+_cache_generation = 0
+_cache_lock = threading.Lock()
+
+
+def _rebuild_index(schedules):
+    global _schedule_index
+    generation = _cache_generation
+    index = dict((id(schedule), idx) for idx, schedule in enumerate(schedules) if schedule)
+    with _cache_lock:
+        if generation == _cache_generation:
+            _schedule_index = (schedules, index)
+    return index
+
+
+@event('manager.config_updated')
+def _invalidate_caches(manager):
+    global _cache_generation, _schedule_index, _schedules_response
+    with _cache_lock:
+        _cache_generation += 1
+        _schedule_index = None
+        _schedules_response = None
+
+
+def _schedule_position(schedule_id, schedules):
+    """Returns the index of the schedule with `schedule_id` in `schedules`, or None if it does not exist."""
+    cached = _schedule_index
+    if cached is None or cached[0] is not schedules:
+        index = _rebuild_index(schedules)
+    else:
+        index = cached[1]
+    idx = index.get(schedule_id)
+    if idx is not None and (idx >= len(schedules) or id(schedules[idx]) != schedule_id):
+        # List has been modified in place since it was indexed
+        idx = _rebuild_index(schedules).get(schedule_id)
+    return idx
+
+
 def _schedule_by_id(schedule_id, schedules):
-    for idx, schedule in enumerate(schedules):
-        if schedule and id(schedule) == schedule_id:
-            schedule = schedule.copy()
-            schedule['id'] = schedule_id
-            return schedule, idx
-    return None, None
+    idx = _schedule_position(schedule_id, schedules)
+    if idx is None:
+        return None, None
+    schedule = schedules[idx].copy()
+    schedule['id'] = schedule_id
+    return schedule, idx
 
 
 schedule_desc = "Schedule ID changes upon daemon restart. The schedules object supports either interval or schedule" \
@@ -48,8 +96,7 @@ class SchedulesAPI(APIResource):
     @api.response(200, model=api_schedules_list_schema)
     def get(self, session=None):
         """ List schedules """
-        schedule_list = []
-
+        global _schedules_response
         schedules = self.manager.config.get('schedules', [])
 
         # Checks for boolean config
@@ -58,14 +105,19 @@ class SchedulesAPI(APIResource):
         elif schedules is False:
             raise Conflict('Schedules are disables in config')
 
-        for schedule in schedules:
-            # Copy the object so we don't apply id to the config
-            schedule_id = id(schedule)
-            schedule = schedule.copy()
-            schedule['id'] = schedule_id
-            schedule_list.append(schedule)
+        cached = _schedules_response
+        if cached is None or cached[0] is not schedules:
+            generation = _cache_generation
+            # Copy the objects so we don't apply id to the config
+            schedule_list = [dict(schedule, id=id(schedule)) for schedule in schedules]
+            data = jsonify(schedule_list).get_data()
+            with _cache_lock:
+                if generation == _cache_generation:
+                    _schedules_response = (schedules, data)
+        else:
+            data = cached[1]
 
-        return jsonify(schedule_list)
+        return Response(data, mimetype='application/json')
 
     @api.validate(base_schedule_schema, description='Schedule Object')
     @api.response(201, model=api_schedule_schema)
@@ -86,6 +138,8 @@ class SchedulesAPI(APIResource):
 
         self.manager.config['schedules'].append(data)
         schedules = self.manager.config['schedules']
+        # Don't rely on the config_updated event alone, another listener may fail before ours is run
+        _invalidate_caches(self.manager)
         new_schedule, _ = _schedule_by_id(id(data), schedules)
 
         if not new_schedule:
@@ -116,29 +170,18 @@ class ScheduleAPI(APIResource):
         elif schedules is False:
             raise Conflict('Schedules are disables in config')
 
-        schedule, _ = _schedule_by_id(schedule_id, schedules)
+        schedule, idx = _schedule_by_id(schedule_id, schedules)
         if schedule is None:
             raise NotFoundError('schedule %d not found' % schedule_id)
 
-        job_id = scheduler_job_map.get(schedule_id)
-        if job_id:
-            job = scheduler.get_job(job_id)
+        # Scheduler is only set up when running as a daemon
+        scheduler = scheduler_plugin.scheduler
+        if scheduler:
+            job = scheduler.get_job(job_id(schedules[idx]))
             if job:
                 schedule['next_run_time'] = job.next_run_time
         return jsonify(schedule)
 
-    def _update_schedule(self, existing, update, merge=False):
-        if 'id' in update:
-            del update['id']
-
-        if not merge:
-            existing.clear()
-
-        existing.update(update)
-        self.manager.save_config()
-        self.manager.config_changed()
-        return existing
-
     @api.validate(base_schedule_schema, description='Updated Schedule Object')
     @api.response(201, model=api_schedule_schema)
     def put(self, schedule_id, session=None):
@@ -157,19 +200,20 @@ class ScheduleAPI(APIResource):
         if not schedule:
             raise NotFoundError('schedule %d not found' % schedule_id)
 
-        new_schedule['id'] = id(schedule)
+        # Replace the config item instead of updating it in place, the schedule gets a new id
         self.manager.config['schedules'][idx] = new_schedule
+        _invalidate_caches(self.manager)
 
         self.manager.save_config()
         self.manager.config_changed()
-        resp = jsonify(new_schedule)
+        resp = jsonify(dict(new_schedule, id=id(new_schedule)))
         resp.status_code = 201
         return resp
 
     @api.response(200, description='Schedule deleted', model=base_message_schema)
     def delete(self, schedule_id, session=None):
         """ Delete a schedule """
-        schedules = self.manager.config.get('schedules')
+        schedules = self.manager.config.get('schedules', [])
 
         # Checks for boolean config
         if schedules is True:
@@ -177,11 +221,12 @@ class ScheduleAPI(APIResource):
         elif schedules is False:
             raise Conflict('Schedules are disables in config')
 
-        for i in range(len(self.manager.config.get('schedules', []))):
-            if id(self.manager.config['schedules'][i]) == schedule_id:
-                del self.manager.config['schedules'][i]
-                self.manager.save_config()
-                self.manager.config_changed()
-                return success_response('schedule %d successfully deleted' % schedule_id)
+        idx = _schedule_position(schedule_id, schedules)
+        if idx is None:
+            raise NotFoundError('schedule %d not found' % schedule_id)
 
-        raise NotFoundError('schedule %d not found' % schedule_id)
+        del schedules[idx]
+        _invalidate_caches(self.manager)
+        self.manager.save_config()
+        self.manager.config_changed()
+        return success_response('schedule %d successfully deleted' % schedule_id)
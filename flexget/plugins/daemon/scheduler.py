@@ -3,6 +3,7 @@ from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
 import hashlib
 import logging
+from collections import OrderedDict
 
 import pytz
 import tzlocal
@@ -19,16 +20,38 @@ from flexget.utils import json
 log = logging.getLogger('scheduler')
 
 
+# Cron schedules which have already passed validation, so the trigger does not get rebuilt on every config load
+_valid_cron_schedules = OrderedDict()
+_VALID_CRON_CACHE_SIZE = 1024
+
+
 # Add a format checker for more detailed errors on cron type schedules
 @format_checker.checks('cron_schedule', raises=ValueError)
 def is_cron_schedule(instance):
     if not isinstance(instance, dict):
         return True
     try:
-        return CronTrigger(**instance)
+        # Include value types, 1, 1.0 and True would otherwise be the same key
+        key = tuple(sorted((name, type(value), value) for name, value in instance.items()))
+        hash(key)
+    except TypeError:
+        # Unhashable values, let CronTrigger complain about them
+        key = None
+    if key is not None and key in _valid_cron_schedules:
+        # Move to the end so that least recently used schedules get evicted first
+        _valid_cron_schedules[key] = _valid_cron_schedules.pop(key)
+        return True
+    try:
+        # Only the fields are validated here, a fixed timezone avoids looking up the local one
+        CronTrigger(timezone=pytz.utc, **instance)
     except TypeError:
         # A more specific error message about which key will also be shown by properties schema keyword
         raise ValueError('Invalid key for schedule.')
+    if key is not None:
+        if len(_valid_cron_schedules) >= _VALID_CRON_CACHE_SIZE:
+            _valid_cron_schedules.popitem(last=False)
+        _valid_cron_schedules[key] = True
+    return True
 
 
 DEFAULT_SCHEDULES = [{'tasks': ['*'], 'interval': {'hours': 1}}]
@@ -61,6 +84,7 @@ cron_schema = {
         'hour': {'type': ['integer', 'string']},
         'minute': {'type': ['integer', 'string']}
     },
+    'format': 'cron_schedule',
     'additionalProperties': False
 }
 
@@ -97,7 +121,8 @@ main_schema = {
 }
 
 scheduler = None
-scheduler_job_map = {}
+# Job ids which were in sync with the jobstore after the last run of `setup_jobs`
+_last_configured_ids = None
 
 
 def job_id(conf):
@@ -115,15 +140,7 @@ def run_job(tasks):
     log.debug('all tasks in schedule finished executing')
 
 
-@event('manager.daemon.started')
-def setup_scheduler(manager):
-    """Configure and start apscheduler"""
-    global scheduler
-    if logging.getLogger().getEffectiveLevel() > logging.DEBUG:
-        logging.getLogger('apscheduler').setLevel(logging.WARNING)
-    jobstores = {'default': SQLAlchemyJobStore(engine=manager.engine, metadata=Base.metadata)}
-    # If job was meant to run within last day while daemon was shutdown, run it once when continuing
-    job_defaults = {'coalesce': True, 'misfire_grace_time': 60 * 60 * 24}
+def _resolve_timezone():
     try:
         timezone = tzlocal.get_localzone()
         if timezone.zone == 'local':
@@ -141,7 +158,20 @@ def setup_scheduler(manager):
         log.info('Local timezone name could not be determined. Scheduler will display times in UTC for any log'
                  'messages. To resolve this set up /etc/timezone with correct time zone name.')
         timezone = pytz.utc
-    scheduler = BackgroundScheduler(jobstores=jobstores, job_defaults=job_defaults, timezone=timezone)
+    return timezone
+
+
+@event('manager.daemon.started')
+def setup_scheduler(manager):
+    """Configure and start apscheduler"""
+    global scheduler, _last_configured_ids
+    if logging.getLogger().getEffectiveLevel() > logging.DEBUG:
+        logging.getLogger('apscheduler').setLevel(logging.WARNING)
+    jobstores = {'default': SQLAlchemyJobStore(engine=manager.engine, metadata=Base.metadata)}
+    # If job was meant to run within last day while daemon was shutdown, run it once when continuing
+    job_defaults = {'coalesce': True, 'misfire_grace_time': 60 * 60 * 24}
+    scheduler = BackgroundScheduler(jobstores=jobstores, job_defaults=job_defaults, timezone=_resolve_timezone())
+    _last_configured_ids = None
     setup_jobs(manager)
 
 
@@ -151,8 +181,7 @@ def setup_jobs(manager):
     if not manager.is_daemon:
         return
 
-    global scheduler_job_map
-    scheduler_job_map = {}
+    global _last_configured_ids
 
     if 'schedules' not in manager.config:
         log.info('No schedules defined in config. Defaulting to run all tasks on a 1 hour interval.')
@@ -163,32 +192,42 @@ def setup_jobs(manager):
         if scheduler.running:
             log.info('Shutting down scheduler')
             scheduler.shutdown()
+        _last_configured_ids = None
         return
     if not scheduler.running:
         log.info('Starting scheduler')
         scheduler.start(paused=True)
-    existing_job_ids = [job.id for job in scheduler.get_jobs()]
-    configured_job_ids = []
+    configured_jobs = {}
     for job_config in config:
         jid = job_id(job_config)
-        configured_job_ids.append(jid)
-        scheduler_job_map[id(job_config)] = jid
-        if jid in existing_job_ids:
-            continue
-        if 'interval' in job_config:
-            trigger, trigger_args = 'interval', job_config['interval']
-        else:
-            trigger, trigger_args = 'cron', job_config['schedule']
-        tasks = job_config['tasks']
-        if not isinstance(tasks, list):
-            tasks = [tasks]
-        name = ','.join(tasks)
-        scheduler.add_job(run_job, args=(tasks,), id=jid, name=name, trigger=trigger, **trigger_args)
-    # Remove jobs no longer in config
-    for jid in existing_job_ids:
-        if jid not in configured_job_ids:
+        configured_jobs[jid] = job_config
+    configured_job_ids = set(configured_jobs)
+    if configured_job_ids == _last_configured_ids:
+        # Schedules did not change, no need to load every job from the jobstore
+        scheduler.resume()
+        return
+    # Keep the scheduler from waking up for every added or removed job, it is woken once when resumed
+    scheduler.pause()
+    try:
+        existing_job_ids = {job.id for job in scheduler.get_jobs()}
+        for jid, job_config in configured_jobs.items():
+            if jid in existing_job_ids:
+                continue
+            if 'interval' in job_config:
+                trigger, trigger_args = 'interval', job_config['interval']
+            else:
+                trigger, trigger_args = 'cron', job_config['schedule']
+            tasks = job_config['tasks']
+            if not isinstance(tasks, list):
+                tasks = [tasks]
+            name = ','.join(tasks)
+            scheduler.add_job(run_job, args=(tasks,), id=jid, name=name, trigger=trigger, **trigger_args)
+        # Remove jobs no longer in config
+        for jid in existing_job_ids - configured_job_ids:
             scheduler.remove_job(jid)
-    scheduler.resume()
+        _last_configured_ids = configured_job_ids
+    finally:
+        scheduler.resume()
 
 
 @event('manager.shutdown_requested')
@@ -1,11 +1,14 @@
 from __future__ import unicode_literals, division, absolute_import
 from builtins import *  # noqa pylint: disable=unused-import, redefined-builtin
 
+from datetime import datetime
+
 from flexget.api.app import base_message
 from flexget.api.plugins.schedule import ObjectsContainer as OC
 from flexget.manager import Manager
+from flexget.plugins.daemon import scheduler as scheduler_plugin
 from flexget.utils import json
-from mock import patch
+from mock import patch, MagicMock
 
 
 class TestEmptyScheduledAPI(object):
@@ -87,6 +90,17 @@ class TestScheduledAPI(object):
         del data['id']
         assert data == payload
 
+    @patch.object(Manager, 'save_config')
+    def test_schedules_post_invalid_cron(self, mocked_save_config, api_client):
+        payload = {
+            'tasks': ['test2'],
+            'schedule': {'hour': '99'}
+        }
+
+        rsp = api_client.json_post('/schedules/', data=json.dumps(payload))
+        assert rsp.status_code == 422, 'Response code is %s' % rsp.status_code
+        assert not mocked_save_config.called
+
     def test_schedules_id_get(self, api_client, schema_match):
         # Get schedules to get their IDs
         rsp = api_client.get('/schedules/')
@@ -178,6 +192,117 @@ class TestScheduledAPI(object):
         assert not errors
         assert mocked_save_config.called
 
+    @patch.object(Manager, 'save_config')
+    def test_schedules_get_after_post(self, mocked_save_config, api_client, schema_match):
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+        assert len(data) == 1
+
+        payload = {
+            'tasks': ['test2', 'test3'],
+            'interval': {'minutes': 10}
+        }
+        rsp = api_client.json_post('/schedules/', data=json.dumps(payload))
+        assert rsp.status_code == 201, 'Response code is %s' % rsp.status_code
+        new_id = json.loads(rsp.get_data(as_text=True))['id']
+
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.schedules_list, data)
+        assert not errors
+
+        assert len(data) == 2
+        assert dict(payload, id=new_id) in data
+
+    @patch.object(Manager, 'save_config')
+    def test_schedules_get_after_put(self, mocked_save_config, api_client, schema_match):
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        schedule_id = json.loads(rsp.get_data(as_text=True))[0]['id']
+
+        payload = {
+            'tasks': ['test2', 'test3'],
+            'interval': {'minutes': 10}
+        }
+        rsp = api_client.json_put('/schedules/{}/'.format(schedule_id), data=json.dumps(payload))
+        assert rsp.status_code == 201, 'Response code is %s' % rsp.status_code
+        new_id = json.loads(rsp.get_data(as_text=True))['id']
+
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.schedules_list, data)
+        assert not errors
+
+        assert data == [dict(payload, id=new_id)]
+
+    @patch.object(Manager, 'save_config')
+    def test_schedules_get_after_delete(self, mocked_save_config, api_client, schema_match):
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        schedule_id = json.loads(rsp.get_data(as_text=True))[0]['id']
+
+        rsp = api_client.delete('/schedules/{}/'.format(schedule_id))
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.schedules_list, data)
+        assert not errors
+
+        assert data == []
+
+    @patch.object(Manager, 'save_config')
+    def test_schedules_id_put_keeps_config_clean(self, mocked_save_config, manager, api_client, schema_match):
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        schedule_id = json.loads(rsp.get_data(as_text=True))[0]['id']
+
+        payload = {
+            'tasks': ['test2', 'test3'],
+            'interval': {'minutes': 10}
+        }
+        rsp = api_client.json_put('/schedules/{}/'.format(schedule_id), data=json.dumps(payload))
+        assert rsp.status_code == 201, 'Response code is %s' % rsp.status_code
+        new_id = json.loads(rsp.get_data(as_text=True))['id']
+
+        assert manager.config['schedules'] == [payload]
+
+        # Returned ID refers to the stored schedule
+        rsp = api_client.get('/schedules/{}/'.format(new_id))
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.schedule_object, data)
+        assert not errors
+
+        assert data == dict(payload, id=new_id)
+
+    def test_schedules_id_get_next_run_time(self, api_client, schema_match):
+        rsp = api_client.get('/schedules/')
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        schedule_id = json.loads(rsp.get_data(as_text=True))[0]['id']
+
+        mocked_scheduler = MagicMock()
+        mocked_scheduler.get_job.return_value = MagicMock(next_run_time=datetime(2026, 1, 1, 12, 0))
+        with patch.object(scheduler_plugin, 'scheduler', mocked_scheduler):
+            rsp = api_client.get('/schedules/{}/'.format(schedule_id))
+        assert rsp.status_code == 200, 'Response code is %s' % rsp.status_code
+        data = json.loads(rsp.get_data(as_text=True))
+
+        errors = schema_match(OC.schedule_object, data)
+        assert not errors
+
+        mocked_scheduler.get_job.assert_called_once_with(scheduler_plugin.job_id(self.schedule))
+        assert data['next_run_time']
+        assert '2026' in data['next_run_time']
+
 
 class TestPositiveBooleanSchedule(object):
     config = """